@@ -1,6 +1,6 @@
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 class Status(Enum):
@@ -10,6 +10,8 @@ class Status(Enum):
 
 
 class Container:
+    __slots__ = ("name", "image", "ports", "volumes", "env", "depends_on", "restart_policy")
+
     def __init__(
         self,
         name: str,
@@ -30,9 +32,12 @@ class Container:
 
 
 class Project:
+    __slots__ = ("name", "path", "containers", "status", "container_statuses", "extra_hosts")
+
     def __init__(self, name: str, path: Path, containers: List[Container] = None):
         self.name = name
         self.path = path
         self.containers = containers or []
         self.status = Status.NOT_CREATED
         self.container_statuses: Dict[str, Status] = {}
+        self.extra_hosts: Tuple[Tuple[str, str], ...] = ()
@@ -1,10 +1,17 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from core.models import Project, Container, Status
 from infrastructure.docker_runner import DockerRunner
 from infrastructure.filesystem import FileRepository
 
+# Upper bound on docker compose invocations running at the same time
+MAX_PARALLEL_COMPOSE = 8
+# Upper bound on compose files parsed at the same time when listing projects
+MAX_PARALLEL_LOADS = min(16, (os.cpu_count() or 1) * 4)
+
 
 class ProjectService:
     def __init__(self, file_repo: FileRepository, docker_runner: DockerRunner):
@@ -12,26 +19,45 @@ class ProjectService:
         self.docker_runner = docker_runner
 
     def list_projects(self, root_path: Path) -> List[Project]:
-        dirs = self.file_repo.scan_directories(root_path)
-        projects = []
-        for d in dirs:
-            project = self.file_repo.load_project(d)
-            self._update_project_statuses(project)
-            projects.append(project)
+        return self.load_projects(self.file_repo.scan_directories(root_path))
+
+    def load_projects(self, dirs: List[Path]) -> List[Project]:
+        """Load the projects in dirs, in order; unchanged compose files are served from the repository cache."""
+        if not dirs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LOADS, len(dirs))) as executor:
+            projects = list(executor.map(self.file_repo.load_project, dirs))
+        self.refresh_all_statuses(projects)
         return projects
 
-    def _update_project_statuses(self, project: Project):
-        project.container_statuses = self.docker_runner.get_container_statuses(project.path)
-        if not project.container_statuses:
+    @staticmethod
+    def _apply_statuses(project: Project, statuses: Dict[str, Status]):
+        project.container_statuses = statuses
+        if not statuses:
             project.status = Status.NOT_CREATED
-        elif any(s == Status.RUNNING for s in project.container_statuses.values()):
+        elif any(s == Status.RUNNING for s in statuses.values()):
             project.status = Status.RUNNING
         else:
             project.status = Status.STOPPED
 
+    def _update_project_statuses(self, project: Project):
+        self._apply_statuses(project, self.docker_runner.get_container_statuses(project.path))
+
+    def refresh_status_only(self, project: Project):
+        """Refresh docker statuses of an already loaded project without re-reading its compose file."""
+        self._update_project_statuses(project)
+
     def refresh_all_statuses(self, projects: List[Project]):
+        if not projects:
+            return
+        all_statuses = self.docker_runner.get_all_container_statuses([p.path for p in projects])
+        if all_statuses is None:
+            # Batched query unavailable; fall back to concurrent per-project lookups
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_COMPOSE, len(projects))) as executor:
+                list(executor.map(self._update_project_statuses, projects))
+            return
         for project in projects:
-            self._update_project_statuses(project)
+            self._apply_statuses(project, all_statuses.get(project.path, {}))
 
     def create_project(
         self,
@@ -46,6 +72,11 @@ class ProjectService:
         self._update_project_statuses(project)
         return project
 
+    @staticmethod
+    def project_exists(root_path: Path, name: str) -> bool:
+        """Cheap existence check that skips loading the compose file and docker status."""
+        return bool(name) and ".." not in name and (root_path / name).exists()
+
     def get_project(self, root_path: Path, name: str) -> Optional[Project]:
         if not name or ".." in name:
             return None
@@ -62,8 +93,8 @@ class ProjectService:
     def delete_project(self, project: Project):
         self.file_repo.delete_project(project.path)
 
-    def start_project(self, project: Project):
-        self.docker_runner.compose_up(project.path)
+    def start_project(self, project: Project, on_progress=None):
+        return self.docker_runner.compose_up(project.path, on_progress)
 
-    def stop_project(self, project: Project):
-        self.docker_runner.compose_down(project.path)
\ No newline at end of file
+    def stop_project(self, project: Project, on_progress=None):
+        return self.docker_runner.compose_down(project.path, on_progress)
@@ -2,6 +2,19 @@ import json
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _loads = json.loads
+
 CONFIG_DIR = Path(__file__).parent.parent
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -14,11 +27,10 @@ class ConfigManager:
         if not CONFIG_FILE.exists():
             return None
         try:
-            with open(CONFIG_FILE, "r") as f:
-                data = json.load(f)
-                root_str = data.get("root_path")
-                if root_str:
-                    return Path(root_str)
+            data = _loads(CONFIG_FILE.read_bytes())
+            root_str = data.get("root_path")
+            if root_str:
+                return Path(root_str)
         except (json.JSONDecodeError, KeyError):
             pass
         return None
@@ -28,5 +40,4 @@ class ConfigManager:
         """Save root_path to config file."""
         CONFIG_DIR.mkdir(exist_ok=True)
         data = {"root_path": str(root_path)}
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        CONFIG_FILE.write_bytes(_dumps(data))
@@ -1,51 +1,205 @@
 import json
+import os
+import signal
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from core.models import Status
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import docker
+except ImportError:
+    docker = None
+
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+COMPOSE_WORKING_DIR_LABEL = "com.docker.compose.project.working_dir"
+
+# Seconds a project's container statuses are reused before docker is queried again
+STATUS_CACHE_TTL = 2.0
+# Seconds a compose up/down may run before it is killed
+COMPOSE_TIMEOUT = 30
+
+
+def paths_by_working_dir(paths: List[Path]) -> Dict[str, Path]:
+    """Map the working_dir label compose puts on a project's containers back to its path.
+
+    The label is matched instead of the project name, which a top-level `name:`
+    or COMPOSE_PROJECT_NAME can override. Both the absolute and the resolved
+    form are keyed, since compose records the directory it was run from.
+    """
+    by_dir: Dict[str, Path] = {}
+    for p in paths:
+        by_dir[str(p.absolute())] = p
+        by_dir.setdefault(str(p.resolve()), p)
+    return by_dir
+
+
+def parse_state(state: str) -> Status:
+    state = state.lower()
+    if "running" in state or "up" in state:
+        return Status.RUNNING
+    if "exited" in state or "stopped" in state:
+        return Status.STOPPED
+    return Status.NOT_CREATED
+
+
 class DockerRunner:
+    def __init__(self):
+        self._status_cache: Dict[Path, Tuple[float, Dict[str, Status]]] = {}
+        # Status queries go straight to the daemon socket when docker-py is
+        # installed; compose up/down still need the CLI plugin.
+        self._client = None
+        if docker is not None:
+            try:
+                self._client = docker.from_env()
+            except docker.errors.DockerException:
+                pass
 
-    @staticmethod
-    def get_container_statuses(path: Path) -> Dict[str, Status]:
-        statuses: Dict[str, Status] = {}
+    def _cached_statuses(self, path: Path) -> Optional[Dict[str, Status]]:
+        cached = self._status_cache.get(path)
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return dict(cached[1])
+        return None
+
+    def get_container_statuses(self, path: Path) -> Dict[str, Status]:
+        if not (path / "docker-compose.yaml").exists():
+            return {}
+        cached = self._cached_statuses(path)
+        if cached is not None:
+            return cached
+        now = time.monotonic()
+        statuses = self._query_container_statuses(path)
+        self._status_cache[path] = (now, statuses)
+        return dict(statuses)
+
+    def _query_container_statuses(self, path: Path) -> Dict[str, Status]:
+        all_statuses = self._sdk_container_statuses([path])
+        if all_statuses is not None:
+            return all_statuses[path]
+        return self._cli_container_statuses(path)
+
+    @classmethod
+    def _cli_container_statuses(cls, path: Path) -> Dict[str, Status]:
         try:
             result = subprocess.run(
                 ["docker", "compose", "ps", "--format", "json"],
                 cwd=path,
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
-            if result.returncode != 0:
-                return statuses
-
-            if not result.stdout.strip():
-                return statuses
+        except (subprocess.TimeoutExpired, Exception):
+            return {}
+        if result.returncode != 0:
+            return {}
+        return cls._parse_compose_ps(result.stdout)
 
-            containers_data = json.loads(result.stdout)
-            if isinstance(containers_data, dict):
-                containers_data = [containers_data]
-            if not isinstance(containers_data, list):
-                return statuses
+    @staticmethod
+    def _parse_compose_ps(output: bytes) -> Dict[str, Status]:
+        statuses: Dict[str, Status] = {}
+        try:
+            # Compose v2 emits one JSON object per line; older releases print
+            # a single JSON array, which still fits on one line.
+            containers_data = []
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                parsed = _json_loads(line)
+                if isinstance(parsed, list):
+                    containers_data.extend(parsed)
+                else:
+                    containers_data.append(parsed)
 
             for cont in containers_data:
                 service_name = cont.get("Service", "")
                 if not service_name:
                     name = cont.get("Name", "")
-                    service_name = name.split("_")[-2] if "_" in name and len(name.split("_")) > 2 else name
-                state = cont.get("State", "").lower()
-                if "running" in state or "up" in state:
-                    statuses[service_name] = Status.RUNNING
-                elif "exited" in state or "stopped" in state:
-                    statuses[service_name] = Status.STOPPED
-                else:
-                    statuses[service_name] = Status.NOT_CREATED
-        except (json.JSONDecodeError, subprocess.TimeoutExpired, Exception):
+                    parts = name.split("_")
+                    service_name = parts[-2] if len(parts) > 2 else name
+                statuses[service_name] = parse_state(cont.get("State", ""))
+        except (json.JSONDecodeError, Exception):
             pass
         return statuses
 
+    def get_all_container_statuses(self, paths: List[Path]) -> Optional[Dict[Path, Dict[str, Status]]]:
+        """Query every compose container with a single docker call.
+
+        Returns statuses keyed by project path, or None if the query failed
+        and callers should fall back to per-project lookups.
+        """
+        all_statuses = self._sdk_container_statuses(paths)
+        if all_statuses is None:
+            all_statuses = self._cli_all_container_statuses(paths)
+        if all_statuses is None:
+            return None
+        now = time.monotonic()
+        for path, statuses in all_statuses.items():
+            self._status_cache[path] = (now, dict(statuses))
+        return all_statuses
+
+    def _sdk_container_statuses(self, paths: List[Path]) -> Optional[Dict[Path, Dict[str, Status]]]:
+        if self._client is None:
+            return None
+        by_dir = paths_by_working_dir(paths)
+        all_statuses: Dict[Path, Dict[str, Status]] = {p: {} for p in paths}
+        label_filter = COMPOSE_PROJECT_LABEL
+        if len(by_dir) == 1:
+            # Single project: let the daemon filter on its working directory
+            label_filter = f"{COMPOSE_WORKING_DIR_LABEL}={next(iter(by_dir))}"
+        try:
+            # Low-level API: one request, no per-container inspect
+            containers = self._client.api.containers(all=True, filters={"label": label_filter})
+        except Exception:
+            return None
+        for cont in containers:
+            labels = cont.get("Labels") or {}
+            path = by_dir.get(labels.get(COMPOSE_WORKING_DIR_LABEL, ""))
+            if path is None:
+                continue
+            names = cont.get("Names") or [""]
+            service_name = labels.get(COMPOSE_SERVICE_LABEL) or names[0].lstrip("/")
+            all_statuses[path][service_name] = parse_state(cont.get("State", ""))
+        return all_statuses
+
+    @staticmethod
+    def _cli_all_container_statuses(paths: List[Path]) -> Optional[Dict[Path, Dict[str, Status]]]:
+        by_dir = paths_by_working_dir(paths)
+        all_statuses: Dict[Path, Dict[str, Status]] = {p: {} for p in paths}
+        try:
+            result = subprocess.run(
+                ["docker", "ps", "--all", "--format", "{{json .}}", "--filter", f"label={COMPOSE_PROJECT_LABEL}"],
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                return None
+
+            for line in result.stdout.splitlines():
+                if not line.strip():
+                    continue
+                cont = _json_loads(line)
+                labels = dict(
+                    label.split("=", 1) for label in cont.get("Labels", "").split(",") if "=" in label
+                )
+                path = by_dir.get(labels.get(COMPOSE_WORKING_DIR_LABEL, ""))
+                if path is None:
+                    continue
+                service_name = labels.get(COMPOSE_SERVICE_LABEL) or cont.get("Names", "")
+                all_statuses[path][service_name] = parse_state(cont.get("State", ""))
+        except (json.JSONDecodeError, subprocess.TimeoutExpired, Exception):
+            return None
+        return all_statuses
+
     def get_status(self, path: Path) -> Status:
         statuses = self.get_container_statuses(path)
         if not statuses:
@@ -54,38 +208,66 @@ class DockerRunner:
             return Status.RUNNING
         return Status.STOPPED
 
-    @staticmethod
-    def compose_up(path: Path):
+    def _run_compose(self, path: Path, args: List[str], on_progress=None) -> str:
+        """Run a docker compose command, passing each progress line (stderr) to on_progress."""
+        cmd = ["docker", "compose", *args]
         try:
-            result = subprocess.run(
-                ["docker", "compose", "up", "-d"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                raise subprocess.CalledProcessError(result.returncode, ["docker", "compose", "up", "-d"], result.stdout, result.stderr)
-            return result.stdout.strip()
+            # stdout goes to a temp file so it cannot fill up while stderr is streamed
+            with tempfile.TemporaryFile() as stdout_file:
+                proc = subprocess.Popen(
+                    cmd,
+                    cwd=path,
+                    stdout=stdout_file,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    start_new_session=True,
+                )
+                timed_out = threading.Event()
+
+                def kill():
+                    # Kill the compose plugin too, or it keeps stderr open
+                    timed_out.set()
+                    try:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    except (AttributeError, OSError):
+                        proc.kill()
+
+                timer = threading.Timer(COMPOSE_TIMEOUT, kill)
+                timer.start()
+                try:
+                    stderr_lines = []
+                    for line in proc.stderr:
+                        line = line.strip()
+                        if line:
+                            stderr_lines.append(line)
+                            if on_progress is not None:
+                                on_progress(line)
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+                    proc.stderr.close()
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cmd, COMPOSE_TIMEOUT)
+                stdout_file.seek(0)
+                output = stdout_file.read().decode(errors="replace")
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd, output, "\n".join(stderr_lines))
+            return output.strip()
+        finally:
+            self._status_cache.pop(path, None)
+
+    def compose_up(self, path: Path, on_progress=None):
+        try:
+            return self._run_compose(path, ["up", "-d"], on_progress)
         except subprocess.TimeoutExpired:
             raise Exception("Docker up timed out—check if paused or heavy volumes.")
         except Exception as e:
             raise Exception(f"Docker up failed: {e}")
 
-    @staticmethod
-    def compose_down(path: Path):
+    def compose_down(self, path: Path, on_progress=None):
         try:
-            result = subprocess.run(
-                ["docker", "compose", "down"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                raise subprocess.CalledProcessError(result.returncode, ["docker", "compose", "down"], result.stdout, result.stderr)
-            return result.stdout.strip()
+            return self._run_compose(path, ["down"], on_progress)
         except subprocess.TimeoutExpired:
             raise Exception("Docker down timed out—check if paused or heavy volumes.")
         except Exception as e:
-            raise Exception(f"Docker down failed: {e}")
\ No newline at end of file
+            raise Exception(f"Docker down failed: {e}")
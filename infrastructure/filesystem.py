@@ -1,9 +1,15 @@
+import copy
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from core.models import Project, Container
 
 DEFAULT_TEMPLATE = {
@@ -16,11 +22,32 @@ DEFAULT_TEMPLATE = {
     },
 }
 
+# DEFAULT_TEMPLATE never changes, so it is serialized only once
+_DEFAULT_YAML_BYTES = yaml.dump(DEFAULT_TEMPLATE, Dumper=SafeDumper).encode()
+
+
+def _normalize_env(env) -> Dict[str, Optional[str]]:
+    """Return compose environment as a dict; the list form is "KEY=value" items.
+
+    A bare "KEY" item passes the host's value through and is kept as None,
+    which is dumped back as compose's equivalent "KEY:" (null) mapping entry.
+    """
+    if not env:
+        return {}
+    if isinstance(env, dict):
+        return env
+    return {k: (v if sep else None) for k, sep, v in (str(item).partition("=") for item in env)}
+
 
 class FileRepository:
+    def __init__(self):
+        # Parsed projects keyed by path, tagged with the compose file's mtime
+        self._project_cache: Dict[Path, Tuple[int, Project]] = {}
+
     @staticmethod
     def scan_directories(root_path: Path):
-        return [p for p in root_path.iterdir() if p.is_dir()]
+        with os.scandir(root_path) as it:
+            return [Path(entry.path) for entry in it if entry.is_dir()]
 
     @staticmethod
     def validate_root_path(root_path: Path) -> bool:
@@ -35,32 +62,32 @@ class FileRepository:
                 return False
         return True
 
-    @staticmethod
-    def load_project(path: Path) -> Project:
+    def load_project(self, path: Path) -> Project:
         compose_path = path / "docker-compose.yaml"
-        if not compose_path.exists():
+        try:
+            mtime_ns = compose_path.stat().st_mtime_ns
+        except OSError:
+            self._project_cache.pop(path, None)
             return Project(path.name, path, containers=[])
-        with open(compose_path) as f:
-            yaml_data = yaml.safe_load(f)
+        cached = self._project_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+        project = self._parse_project(path, compose_path)
+        self._project_cache[path] = (mtime_ns, project)
+        return copy.deepcopy(project)
+
+    @staticmethod
+    def _parse_project(path: Path, compose_path: Path) -> Project:
+        yaml_data = yaml.load(compose_path.read_bytes(), Loader=SafeLoader)
         containers = []
         extra_hosts = {}
         for name, conf in yaml_data.get("services", {}).items():
 
-            ports: Dict[str, str] = {}
-            ports_list = conf.get("ports", [])
-            for port_str in ports_list:
-                if ":" in port_str:
-                    host_port, cont_port = port_str.split(":", 1)
-                    ports[host_port] = cont_port
+            ports: Dict[str, str] = dict(p.split(":", 1) for p in conf.get("ports", []) if ":" in p)
 
-            volumes: Dict[str, str] = {}
-            volumes_list = conf.get("volumes", [])
-            for vol_str in volumes_list:
-                if ":" in vol_str:
-                    host_vol, cont_vol = vol_str.split(":", 1)
-                    volumes[host_vol] = cont_vol
+            volumes: Dict[str, str] = dict(v.split(":", 1) for v in conf.get("volumes", []) if ":" in v)
 
-            env: Dict[str, str] = conf.get("environment", {}) or {}
+            env: Dict[str, Optional[str]] = _normalize_env(conf.get("environment"))
 
             depends_on: List[str] = conf.get("depends_on", [])
 
@@ -76,11 +103,11 @@ class FileRepository:
                 )
             )
         project = Project(path.name, path, containers)
-        project.extra_hosts = list(extra_hosts.items()) if extra_hosts else []
+        project.extra_hosts = tuple(extra_hosts.items())
         return project
 
-    @staticmethod
-    def save_project(project: Project):
+    def save_project(self, project: Project):
+        self._project_cache.pop(project.path, None)
         services = {}
         for c in project.containers:
             service_conf = {
@@ -93,12 +120,10 @@ class FileRepository:
             if c.env:
                 service_conf["environment"] = c.env
             services[c.name] = service_conf
-        yaml_data = {"services": services}
-        with open(project.path / "docker-compose.yaml", "w") as f:
-            yaml.safe_dump(yaml_data, f)
+        self._write_compose(project.path / "docker-compose.yaml", {"services": services})
 
-    @staticmethod
-    def create_compose(path: Path, containers: List[Container] = None):
+    def create_compose(self, path: Path, containers: List[Container] = None):
+        self._project_cache.pop(path, None)
         path.mkdir(parents=True, exist_ok=True)
         compose_file = path / "docker-compose.yaml"
 
@@ -115,19 +140,29 @@ class FileRepository:
                 service_conf["environment"] = c.env
             services[c.name] = service_conf
         if not services:
-            yaml.safe_dump(DEFAULT_TEMPLATE, open(compose_file, "w"))
+            self._replace_file(compose_file, _DEFAULT_YAML_BYTES)
         else:
-            yaml_data = {"services": services}
-            with open(compose_file, "w") as f:
-                yaml.safe_dump(yaml_data, f)
+            self._write_compose(compose_file, {"services": services})
+
+    @classmethod
+    def _write_compose(cls, compose_file: Path, yaml_data: Dict):
+        cls._replace_file(compose_file, yaml.dump(yaml_data, Dumper=SafeDumper).encode())
+
+    @staticmethod
+    def _replace_file(path: Path, content: bytes):
+        """Write content once to a temp file, then atomically swap it into place."""
+        tmp_file = path.with_suffix(".yaml.tmp")
+        tmp_file.write_bytes(content)
+        os.replace(tmp_file, path)
 
     def create_default_compose(self, path: Path):
         self.create_compose(path, [])
 
-    @staticmethod
-    def delete_project(path: Path):
+    def delete_project(self, path: Path):
+        self._project_cache.pop(path, None)
         if path.exists():
-            for item in path.iterdir():
-                if item.is_file():
-                    item.unlink()
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        os.unlink(entry.path)
             path.rmdir()
@@ -1,40 +1,42 @@
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# One "ip host [host ...]" entry per line; trailing comments are excluded
+_HOSTS_LINE_RE = re.compile(r"^[ \t]*(?!#)(\S+)[ \t]+([^\n#]+)", re.MULTILINE)
+# Comma-separated "key:value" items ("ip:host" entries here, ports and volumes in the
+# UI); only the first colon separates the pair
+COLON_PAIR_RE = re.compile(r"(?:^|,)\s*([^,:]*?)\s*:\s*([^,]*?)\s*(?=,|$)")
 
 
 class HostsLoader:
-    @staticmethod
-    def load_system_hosts() -> List[Tuple[str, str]]:
+    # (st_mtime_ns, parsed entries) of the last /etc/hosts read
+    _cache: Optional[Tuple[int, List[Tuple[str, str]]]] = None
+
+    @classmethod
+    def load_system_hosts(cls) -> List[Tuple[str, str]]:
         """Parse /etc/hosts and return list of (ip, host) tuples."""
         hosts: List[Tuple[str, str]] = []
         hosts_file = Path("/etc/hosts")
-        if not hosts_file.exists():
+        try:
+            mtime_ns = hosts_file.stat().st_mtime_ns
+        except OSError:
             return hosts
+        if cls._cache and cls._cache[0] == mtime_ns:
+            return list(cls._cache[1])
         try:
-            with open(hosts_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        parts = re.split(r"\s+", line, maxsplit=1)
-                        if len(parts) >= 2:
-                            ip, host_entry = parts
-                            hosts_list = host_entry.split()
-                            for host in hosts_list:
-                                hosts.append((ip, host))
+            text = hosts_file.read_text()
+            for ip, host_entry in _HOSTS_LINE_RE.findall(text):
+                for host in host_entry.split():
+                    hosts.append((ip, host))
         except Exception:
-            pass
-        return hosts
+            return hosts
+        cls._cache = (mtime_ns, hosts)
+        return list(hosts)
 
     @staticmethod
     def parse_custom_hosts(input_str: str) -> List[Tuple[str, str]]:
         """Parse comma-separated 'ip:host' from string."""
-        hosts: List[Tuple[str, str]] = []
         if not input_str:
-            return hosts
-        entries = [e.strip() for e in input_str.split(",") if e.strip()]
-        for entry in entries:
-            if ":" in entry:
-                ip, host = entry.split(":", 1)
-                hosts.append((ip.strip(), host.strip()))
-        return hosts
+            return []
+        return COLON_PAIR_RE.findall(input_str)
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from core.models import Status
+from infrastructure.docker_runner import DockerRunner
+from infrastructure.hosts_loader import COLON_PAIR_RE, HostsLoader
+
+
+def _split_pairs(raw, sep):
+    """The hand-written loop the precompiled pair regexes replaced."""
+    pairs = {}
+    for p in raw.split(","):
+        p = p.strip()
+        if sep in p:
+            k, v = p.split(sep, 1)
+            pairs[k.strip()] = v.strip()
+    return pairs
+
+
+def _split_env(raw):
+    env = {}
+    for p in raw.split(","):
+        p = p.strip()
+        if "=" in p:
+            k, v = p.split("=", 1)
+            env[k.strip()] = v.strip()
+        elif p:
+            env[p] = None
+    return env
+
+
+def _split_hosts(raw):
+    hosts = []
+    for entry in [e.strip() for e in raw.split(",") if e.strip()]:
+        if ":" in entry:
+            ip, host = entry.split(":", 1)
+            hosts.append((ip.strip(), host.strip()))
+    return hosts
+
+
+def _random_fields(alphabet, count=2000, seed=1234):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20))) for _ in range(count)]
+
+
+class TestParsePairs:
+    @pytest.fixture(autouse=True)
+    def _flet_app(self):
+        self.app = pytest.importorskip("ui.flet_app")
+
+    def test_ports(self):
+        parsed = self.app._parse_pairs("8080:80, 9000 : 9000,bad,,127.0.0.1:53:53", COLON_PAIR_RE)
+        assert parsed == {"8080": "80", "9000": "9000", "127.0.0.1": "53:53"}
+
+    def test_empty(self):
+        assert self.app._parse_pairs("", COLON_PAIR_RE) == {}
+        assert self.app._parse_pairs(None, COLON_PAIR_RE) == {}
+
+    def test_matches_split_loop(self):
+        for raw in _random_fields("ab:, "):
+            assert self.app._parse_pairs(raw, COLON_PAIR_RE) == _split_pairs(raw, ":"), raw
+
+    def test_env(self):
+        parsed = self.app._parse_env("A=1, PASSTHRU ,B = x=y,, C=")
+        assert parsed == {"A": "1", "PASSTHRU": None, "B": "x=y", "C": ""}
+
+    def test_env_matches_split_loop(self):
+        for raw in _random_fields("ab=, "):
+            assert self.app._parse_env(raw) == _split_env(raw), raw
+
+    def test_format_pairs_shows_bare_keys(self):
+        assert self.app._format_pairs({"A": "1", "P": None}, "%s=%s") == "A=1, P"
+        assert self.app._format_pairs({}) == "None"
+
+
+class TestCustomHosts:
+    def test_entries(self):
+        assert HostsLoader.parse_custom_hosts("1.2.3.4:a, 5.6.7.8 : b ,bad,, ::1:c") == [
+            ("1.2.3.4", "a"),
+            ("5.6.7.8", "b"),
+            ("", ":1:c"),
+        ]
+
+    def test_empty(self):
+        assert HostsLoader.parse_custom_hosts("") == []
+
+    def test_matches_split_loop(self):
+        for raw in _random_fields("ab:, "):
+            assert HostsLoader.parse_custom_hosts(raw) == _split_hosts(raw), raw
+
+
+class TestNormalizeEnv:
+    @pytest.fixture(autouse=True)
+    def _filesystem(self):
+        pytest.importorskip("yaml")
+        from infrastructure import filesystem
+        self.normalize = filesystem._normalize_env
+
+    def test_list_form(self):
+        assert self.normalize(["FOO=1", "BAR=a=b", "PASSTHRU"]) == {"FOO": "1", "BAR": "a=b", "PASSTHRU": None}
+
+    def test_dict_form_and_empty(self):
+        assert self.normalize({"FOO": "1", "PASSTHRU": None}) == {"FOO": "1", "PASSTHRU": None}
+        assert self.normalize(None) == {}
+        assert self.normalize([]) == {}
+
+
+class TestParseComposePs:
+    def test_ndjson(self):
+        output = (
+            b'{"Service": "web", "Name": "p-web-1", "State": "running"}\n'
+            b'\n'
+            b'{"Service": "db", "Name": "p-db-1", "State": "exited"}\n'
+        )
+        assert DockerRunner._parse_compose_ps(output) == {"web": Status.RUNNING, "db": Status.STOPPED}
+
+    def test_single_array(self):
+        output = b'[{"Service": "web", "State": "running"}, {"Name": "proj_cache_1", "State": "created"}]\n'
+        assert DockerRunner._parse_compose_ps(output) == {"web": Status.RUNNING, "cache": Status.NOT_CREATED}
+
+    def test_garbage(self):
+        assert DockerRunner._parse_compose_ps(b"not json\n") == {}
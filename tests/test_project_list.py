@@ -0,0 +1,34 @@
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from core.models import Container, Project, Status
+
+
+def _project(name, status=Status.NOT_CREATED, containers=("web",)):
+    project = Project(name, Path("/projects") / name, [Container(c, "nginx:latest") for c in containers])
+    project.status = status
+    project.container_statuses = {c: status for c in containers}
+    return project
+
+
+class TestCopyStatuses:
+    @pytest.fixture(autouse=True)
+    def _flet_app(self):
+        self.app = pytest.importorskip("ui.flet_app")
+
+    def test_refresh_then_delete(self):
+        projects = [_project("a"), _project("b")]
+        # Delete handlers are bound to the objects the cards were built from
+        delete_b = partial(projects.index, projects[1])
+        assert self.app._copy_statuses(projects, [_project("a", Status.RUNNING), _project("b", Status.STOPPED)])
+        assert [p.status for p in projects] == [Status.RUNNING, Status.STOPPED]
+        assert projects[1].container_statuses == {"web": Status.STOPPED}
+        assert delete_b() == 1
+
+    def test_layout_changed(self):
+        projects = [_project("a")]
+        assert not self.app._copy_statuses(projects, [_project("a", Status.RUNNING, ("web", "db"))])
+        assert not self.app._copy_statuses(projects, [_project("a"), _project("b")])
+        assert projects[0].status is Status.NOT_CREATED
@@ -1,6 +1,14 @@
-import shutil
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
 import flet as ft
@@ -26,10 +34,169 @@ from flet import (
     TextButton,
 )
 
-from core.models import Status, Container
+from core.models import Status, Container, Project
 from core.services import ProjectService
 from infrastructure.config import ConfigManager
 from infrastructure.filesystem import FileRepository
+from infrastructure.hosts_loader import COLON_PAIR_RE
+
+# Project cards are materialized in pages of this size as the list is scrolled
+PROJECT_LIST_PAGE_SIZE = 20
+# Distance (px) from the end of the list at which the next page is rendered
+PROJECT_LIST_LOAD_AHEAD = 300
+# Most recently used views kept built across route changes
+VIEW_CACHE_SIZE = 8
+# Seconds a route change is held back so a burst of navigations renders only the last route
+ROUTE_DEBOUNCE = 0.015
+# Minimum seconds between progress lines shown in the busy dialog
+BUSY_PROGRESS_INTERVAL = 0.2
+
+# Style objects shared by every view build instead of being rebuilt per route change
+_SHAPE_R8 = ft.RoundedRectangleBorder(radius=8)
+_BTN_GREEN = ft.ButtonStyle(bgcolor="green", color="white", shape=_SHAPE_R8)
+_BTN_BLUE = ft.ButtonStyle(bgcolor="blue", color="white", shape=_SHAPE_R8)
+_BTN_GREY = ft.ButtonStyle(bgcolor="grey", color="white", shape=_SHAPE_R8)
+_BTN_ORANGE = ft.ButtonStyle(bgcolor="orange", color="white", shape=_SHAPE_R8)
+_BTN_TEXT_GREEN = ft.ButtonStyle(color="green")
+_BTN_TEXT_RED = ft.ButtonStyle(color="red")
+_ROW_BORDER = border.all(1, "grey_300")
+_ROW_RADIUS = border_radius.all(8)
+_ROW_PAD = padding.all(15)
+_VIEW_PAD = padding.all(40)
+_PLACEHOLDER_PAD = padding.all(50)
+_CARD_PAD = padding.all(10)
+_TILE_BODY_PAD = padding.only(left=16, bottom=8)
+
+# Status -> (icon, color, label) used by status indicators
+_STATUS_META = {
+    Status.RUNNING: ("check_circle", "green", "Running"),
+    Status.STOPPED: ("pause_circle", "red", "Stopped"),
+    Status.NOT_CREATED: ("radio_button_unchecked", "grey", "Not created"),
+}
+
+# Text presets for secondary detail lines and form section headings
+_small_grey_text = partial(Text, size=12, color="grey_600")
+_section_label = partial(Text, size=16, weight=ft.FontWeight.W_600)
+
+# Sort key for project lists
+_BY_NAME = attrgetter("name")
+
+# Restart policies offered per container. DropdownOption is a child control
+# bound to one parent, so only the values are shared between cards.
+_RESTART_POLICIES = ("no", "on-failure", "always", "unless-stopped")
+
+# "KEY=value" or bare "KEY" (host pass-through) items of the env field
+_ENV_ITEM_RE = re.compile(r"(?:^|,)\s*([^,=]*?)\s*(?:(=)\s*([^,]*?))?\s*(?=,|$)")
+
+
+def _parse_pairs(raw: Optional[str], pattern: re.Pattern) -> Dict[str, str]:
+    if not raw:
+        return {}
+    return dict(pattern.findall(raw))
+
+
+def _parse_env(raw: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse the env field; a bare KEY maps to None (pass the host's value through)."""
+    if not raw:
+        return {}
+    return {k: (v if sep else None) for k, sep, v in _ENV_ITEM_RE.findall(raw) if k or sep}
+
+
+def _format_pairs(pairs: Dict[str, Optional[str]], fmt: str = "%s:%s") -> str:
+    """Render a mapping for display as "k:v, k:v", or "None" when empty. None values show as a bare key."""
+    if not pairs:
+        return "None"
+    return ", ".join([k if v is None else fmt % (k, v) for k, v in pairs.items()])
+
+
+def _parse_containers(card_fields) -> List[Container]:
+    """Build Containers from container card fields, skipping cards without a name."""
+    containers = []
+    for fields in card_fields:
+        cname = fields['name'].value.strip()
+        if not cname:
+            continue
+        depends_raw = fields['depends_on'].value
+        containers.append(
+            Container(
+                cname,
+                fields['image'].value.strip() or "nginx:latest",
+                _parse_pairs(fields['ports'].value, COLON_PAIR_RE),
+                _parse_pairs(fields['volumes'].value, COLON_PAIR_RE),
+                _parse_env(fields['env'].value),
+                [d for d in map(str.strip, depends_raw.split(",")) if d] if depends_raw else [],
+                fields['restart'].value or "unless-stopped",
+            )
+        )
+    return containers
+
+
+def _route_project_name(route: str, prefix: str) -> str:
+    """Return the decoded project name following prefix in route, or ""."""
+    _, found, name = route.partition(prefix)
+    if not found:
+        return ""
+    return unquote(name) if "%" in name else name
+
+
+def _card_layout(project: Project):
+    return project.name, [(cont.name, cont.image) for cont in project.containers]
+
+
+def _copy_statuses(projects: List[Project], loaded: List[Project]) -> bool:
+    """Copy docker state from freshly loaded projects onto the ones already on screen.
+
+    Cards and their handlers stay bound to the existing Project objects. Returns False,
+    changing nothing, when the projects or their containers differ and the cards need
+    rendering again.
+    """
+    if list(map(_card_layout, loaded)) != list(map(_card_layout, projects)):
+        return False
+    for proj, fresh in zip(projects, loaded):
+        proj.status = fresh.status
+        proj.container_statuses = fresh.container_statuses
+    return True
+
+
+def _show_status_icon(icon: ft.Icon, status: Status):
+    """Point an existing status icon at status in place."""
+    icon.name, icon.color, icon.tooltip = _STATUS_META[status]
+
+
+# Blocking filesystem/docker work runs here so event handlers return immediately
+_io_executor = ThreadPoolExecutor(max_workers=4)
+
+
+# Held for the whole of a batch, so batches opened from different handler threads
+# (flet runs sync handlers on a thread pool) install and remove the override in turn
+_batch_lock = threading.RLock()
+
+
+@contextmanager
+def batched_updates(page: ft.Page):
+    """Coalesce page/control update() calls made inside the block into one page.update() on exit.
+
+    Only updates from the thread that opened the batch are deferred; other threads
+    keep updating the page as usual.
+    """
+    with _batch_lock:
+        if "update" in vars(page):
+            # Already inside a batch on this thread; the outermost block flushes
+            yield
+            return
+        flush = page.update
+        owner = threading.get_ident()
+
+        def update(*controls):
+            if threading.get_ident() != owner:
+                flush(*controls)
+
+        page.update = update
+        try:
+            yield
+        finally:
+            del page.update  # drop the instance override, exposing Page.update again
+            flush()
 
 
 def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
@@ -45,9 +212,146 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
         # Global file_repo for validation
         file_repo = FileRepository()
 
+        # Root path for this session; replaced when /setup saves a new one
+        active_root = root_path
+        # Project directories per root, sorted by name and tagged with the root directory's mtime.
+        # The root mtime only tracks projects being added or removed, so only the directory
+        # scan is skipped; compose files and docker state are re-checked on every load.
+        projects_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+
+        def get_projects_cached(root: Path) -> List[Project]:
+            try:
+                mtime_ns = root.stat().st_mtime_ns
+            except OSError:
+                projects = service_instance.list_projects(root)
+                projects.sort(key=_BY_NAME)
+                return projects
+            cached = projects_cache.get(root)
+            if cached and cached[0] == mtime_ns:
+                return service_instance.load_projects(cached[1])
+            projects = service_instance.list_projects(root)
+            projects.sort(key=_BY_NAME)
+            projects_cache[root] = (mtime_ns, [p.path for p in projects])
+            return projects
+
+        def invalidate_projects():
+            projects_cache.clear()
+            invalidate_views()
+
+        # Built views per route, tagged with the data version they were built from
+        view_cache: OrderedDict[str, Tuple[View, int]] = OrderedDict()
+        data_version = 0
+
+        def invalidate_views():
+            nonlocal data_version
+            data_version += 1
+
+        def keep_view(route):
+            """Carry a cached view that was patched in place over to the current data version."""
+            cached = view_cache.get(route)
+            if cached:
+                view_cache[route] = (cached[0], data_version)
+
+        busy_text = Text("Working...")
+        busy_dialog = AlertDialog(
+            modal=True,
+            content=Row([ProgressRing(width=20, height=20), busy_text], tight=True),
+        )
+        # When the busy text last changed, and the newest line held back since then
+        last_progress = 0.0
+        pending_progress: Optional[str] = None
+
+        def set_busy_text(line):
+            busy_text.value = line
+            if busy_text.page:
+                busy_text.update()
+
+        def show_progress(line):
+            """Show a progress line from a background job in the busy dialog, throttled."""
+            nonlocal last_progress, pending_progress
+            now = time.monotonic()
+            if now - last_progress < BUSY_PROGRESS_INTERVAL:
+                pending_progress = line
+                return
+            last_progress = now
+            pending_progress = None
+            set_busy_text(line)
+
+        def flush_progress():
+            """Show the last progress line if the throttle held it back."""
+            nonlocal pending_progress
+            if pending_progress is not None:
+                line, pending_progress = pending_progress, None
+                set_busy_text(line)
+
+        def run_io(func, *args, on_done, on_error=None):
+            """Run func(*args) on the IO executor behind a busy dialog, then hand the result back."""
+            nonlocal last_progress, pending_progress
+            busy_text.value = "Working..."
+            last_progress = 0.0
+            pending_progress = None
+            page.open(busy_dialog)
+
+            def finished(fut):
+                # Closing the busy dialog and the handler's own updates go out together
+                with batched_updates(page):
+                    page.close(busy_dialog)
+                    try:
+                        result = fut.result()
+                    except Exception as ex:
+                        if on_error is None:
+                            raise
+                        on_error(ex)
+                        return
+                    on_done(result)
+
+            _io_executor.submit(func, *args).add_done_callback(lambda fut: page.run_thread(finished, fut))
+
+        # One snackbar for the whole session; notify() swaps its text and colour
+        snack_text = Text("")
+        snack_bar = ft.SnackBar(content=snack_text)
+        page.overlay.append(snack_bar)
+
+        def notify(message, bgcolor=None):
+            """Show message in the shared snackbar on the next page update."""
+            snack_text.value = message
+            snack_bar.bgcolor = bgcolor
+            snack_bar.open = True
+
+        def notify_and_go(message, route, bgcolor=None):
+            """Show a snackbar and navigate, shipping both in one page update."""
+            with batched_updates(page):
+                notify(message, bgcolor)
+                page.go(route)
+
+        # (route, root, data version) the current view stack was rendered for
+        rendered_state = None
+        # Debounce timer for the next render, and a lock so renders never overlap
+        pending_render: Optional[threading.Timer] = None
+        pending_lock = threading.Lock()
+        render_lock = threading.Lock()
+
         def route_change(e):
-            # Dynamically load current root_path on every route change
-            current_root = ConfigManager.load_root_path()
+            """Coalesce route changes arriving within ROUTE_DEBOUNCE; only the latest route renders."""
+            nonlocal pending_render
+            with pending_lock:
+                if pending_render is not None:
+                    pending_render.cancel()
+                pending_render = threading.Timer(ROUTE_DEBOUNCE, render_route)
+                pending_render.daemon = True
+                pending_render.start()
+
+        def render_route():
+            with render_lock:
+                build_route()
+
+        def build_route():
+            nonlocal rendered_state
+            current_root = active_root
+            render_state = (page.route, current_root, data_version)
+            if render_state == rendered_state and page.views:
+                # Repeated navigation to what is already shown
+                return
 
             page.views.clear()
 
@@ -61,33 +365,29 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 def validate_path_click(event):
                     if not path_field.value or not path_field.value.strip():
-                        snack = ft.SnackBar(content=ft.Text("Please enter a path."))
-                        page.snack_bar = snack
+                        notify("Please enter a path.")
                         page.update()
                         return
                     candidate_path = Path(path_field.value.strip())
-                    if file_repo.validate_root_path(candidate_path):
-                        ConfigManager.save_root_path(candidate_path)
-                        snack = ft.SnackBar(content=ft.Text(f"Root path '{candidate_path}' set successfully!"))
-                        page.snack_bar = snack
-                        page.update()
-                        page.go("/")  # Navigate to main; next route_change will load the new path
-                    else:
-                        snack = ft.SnackBar(
-                            content=ft.Text("Invalid path: Must exist or be creatable, and writable."),
-                            bgcolor="red",
-                        )
-                        page.snack_bar = snack
-                        page.update()
+
+                    def path_validated(valid):
+                        nonlocal active_root
+                        if valid:
+                            ConfigManager.save_root_path(candidate_path)
+                            active_root = candidate_path
+                            invalidate_projects()
+                            # Navigate to main; next route_change will load the new path
+                            notify_and_go(f"Root path '{candidate_path}' set successfully!", "/")
+                        else:
+                            notify("Invalid path: Must exist or be creatable, and writable.", bgcolor="red")
+                            page.update()
+
+                    run_io(file_repo.validate_root_path, candidate_path, on_done=path_validated)
 
                 validate_button = ElevatedButton(
                     "Validate & Save",
                     on_click=validate_path_click,
-                    style=ft.ButtonStyle(
-                        bgcolor="green",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_GREEN,
                 )
 
                 setup_container = ft.Container(
@@ -101,7 +401,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                         horizontal_alignment=alignment.center,
                         spacing=20,
                     ),
-                    padding=padding.all(40),
+                    padding=_VIEW_PAD,
                     alignment=alignment.center,
                 )
 
@@ -119,193 +419,272 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                     # Fallback: redirect to setup
                     page.go("/setup")
                     return None
-                projects = service_instance.list_projects(current_root)
-                projects.sort(key=lambda p: p.name)  # New: Sort by name
-                project_list = ListView(
-                    spacing=10,
-                    padding=padding.all(20),
-                    expand=True,
+                projects: List[Project] = []
+
+                # Row handlers are defined once per view and bound per project with partial
+                def open_detail_click(project_name, event):
+                    page.go(f"/detail/{project_name}")
+
+                def deleted(project, _):
+                    nonlocal rendered_count
+                    # Drop just this card instead of reloading the whole list
+                    index = projects.index(project)
+                    del projects[index]
+                    if index < rendered_count:
+                        del project_list.controls[index]
+                        del card_icons[index]
+                        rendered_count -= 1
+                    if not projects:
+                        show_projects()
+                    invalidate_projects()
+                    keep_view("/")
+                    notify("Deleted successfully")
+                    page.update()
+
+                def delete_failed(ex):
+                    notify(f"Delete failed: {str(ex)}", bgcolor=ft.Colors.RED)
+                    page.update()
+
+                # One confirmation dialog per view; delete_click retargets it
+                pending_delete: Optional[Project] = None
+
+                def confirm_delete(e):
+                    page.close(delete_dialog)
+                    project = pending_delete
+                    run_io(service_instance.delete_project, project, on_done=partial(deleted, project), on_error=delete_failed)
+
+                def delete_click(project, e):
+                    nonlocal pending_delete
+                    pending_delete = project
+                    delete_text.value = f"Delete project '{project.name}'? This cannot be undone."
+                    page.open(delete_dialog)
+
+                delete_text = Text()
+                delete_dialog = AlertDialog(
+                    modal=True,
+                    title=Text("Confirm Delete"),
+                    content=delete_text,
+                    actions=[
+                        TextButton("Yes", on_click=confirm_delete),
+                        TextButton("No", on_click=lambda e: page.close(delete_dialog)),
+                    ],
+                    actions_alignment=MainAxisAlignment.END,
                 )
-                if not projects:
-                    empty_state = ft.Container(
-                        content=Text(
-                            "No projects yet. Create one to get started!",
-                            size=16,
-                            text_align=ft.TextAlign.CENTER,
-                            color="grey_600",
-                        ),
-                        alignment=alignment.center,
-                        padding=padding.all(50),
-                        expand=True,
-                    )
-                    project_list.controls.append(empty_state)
-                else:
-                    for proj in projects:
-                        status_str = str(proj.status)
-                        status_color = "green" if proj.status == Status.RUNNING else "grey" if proj.status == Status.NOT_CREATED else "red"
-                        status_icon = "check_circle" if proj.status == Status.RUNNING else "radio_button_unchecked" if proj.status == Status.NOT_CREATED else "pause_circle"
-
-                        # Sub-bullets for containers
-                        containers_col = Column(spacing=5)
-                        for cont in proj.containers:
-                            cont_status = proj.container_statuses.get(cont.name, Status.NOT_CREATED)
-                            cont_status_str = str(cont_status)
-                            cont_status_color = "green" if cont_status == Status.RUNNING else "grey" if cont_status == Status.NOT_CREATED else "red"
-                            cont_status_icon = "check_circle" if cont_status == Status.RUNNING else "radio_button_unchecked" if cont_status == Status.NOT_CREATED else "pause_circle"
-                            containers_col.controls.append(
-                                Row(
-                                    [
-                                        Row(
-                                            [
-                                                Text("•", size=14),
-                                                Text(f"{cont.name}", size=14, weight=ft.FontWeight.W_500),
-                                                Text(f"({cont.image})", size=12, color="grey_600"),
-                                            ],
-                                            alignment=MainAxisAlignment.START,
-                                        ),
-                                        IconButton(
-                                            icon=cont_status_icon,
-                                            icon_color=cont_status_color,
-                                            tooltip=cont_status_str,
-                                            icon_size=16,
-                                        ),
-                                    ],
-                                    alignment=MainAxisAlignment.SPACE_BETWEEN,
-                                )
-                            )
-                        
-                        # Slim header: Name + status icon + Open button + Delete button
-                        def open_detail_click(event, project=proj):
-                            page.go(f"/detail/{project.name}")
-
-                        # New: Delete handler with closure
-                        def make_delete_click(project):
-                            def delete_click(e):
-                                def confirm():
-                                    page.close(dialog)
-                                    try:
-                                        service_instance.delete_project(project)
-                                        page.snack_bar = ft.SnackBar(content=ft.Text("Deleted successfully"))
-                                        page.snack_bar.open = True
-                                        page.update()
-                                        page.go("/")
-                                    except Exception as ex:
-                                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Delete failed: {str(ex)}"), bgcolor=ft.Colors.RED)
-                                        page.snack_bar.open = True
-                                        page.update()
-
-                                dialog = AlertDialog(
-                                    modal=True,
-                                    title=Text("Confirm Delete"),
-                                    content=Text(f"Delete project '{project.name}'? This cannot be undone."),
-                                    actions=[
-                                        TextButton("Yes", on_click=lambda _: confirm()),
-                                        TextButton("No", on_click=lambda _: page.close(dialog)),
-                                    ],
-                                    actions_alignment=MainAxisAlignment.END,
-                                )
-                                page.dialog = dialog
-                                page.open(dialog)
-                                page.update()
-                            return delete_click
-
-                        project_container = ft.Container(
-                            content=ft.Column(
+
+                # Build one project card; only called for rows being materialized
+                def build_project_card(proj):
+                    status_icon, status_color, status_str = _STATUS_META[proj.status]
+
+                    # Sub-bullets for containers
+                    container_rows = []
+                    container_icons: Dict[str, ft.Icon] = {}
+                    container_statuses = proj.container_statuses
+                    for cont in proj.containers:
+                        cont_status = container_statuses.get(cont.name, Status.NOT_CREATED)
+                        cont_status_icon, cont_status_color, cont_status_str = _STATUS_META[cont_status]
+                        cont_icon = ft.Icon(name=cont_status_icon, color=cont_status_color, size=16, tooltip=cont_status_str)
+                        container_icons[cont.name] = cont_icon
+                        container_rows.append(
+                            Row(
                                 [
                                     Row(
                                         [
-                                            Text(proj.name, size=18, weight=ft.FontWeight.BOLD),
-                                            IconButton(
-                                                icon=status_icon,
-                                                icon_color=status_color,
-                                                tooltip=status_str,
-                                            ),
-                                            IconButton(
-                                                icon="open_in_new",
-                                                icon_color="blue",
-                                                on_click=open_detail_click,
-                                                tooltip="Open Detail",
-                                            ),
-                                            IconButton(
-                                                icon="delete",
-                                                icon_color="red",
-                                                on_click=make_delete_click(proj),
-                                                tooltip="Delete Project",
-                                            ),
+                                            Text("•", size=14),
+                                            Text(f"{cont.name}", size=14, weight=ft.FontWeight.W_500),
+                                            _small_grey_text(f"({cont.image})"),
                                         ],
-                                        alignment=alignment.center,
-                                        expand=True
+                                        alignment=MainAxisAlignment.START,
                                     ),
-                                    Text(f"Path: {proj.path}", size=12, color="grey_700"),
-                                    Text("Containers:", size=14, weight=ft.FontWeight.W_600, color="grey_800"),
-                                    containers_col,
+                                    cont_icon,
                                 ],
-                                spacing=10,
+                                alignment=MainAxisAlignment.SPACE_BETWEEN,
+                            )
+                        )
+                    containers_col = Column(container_rows, spacing=5)
+                    header_icon = ft.Icon(name=status_icon, color=status_color, tooltip=status_str)
+                    card_icons.append((header_icon, container_icons))
+
+                    # Slim header: Name + status icon + Open button + Delete button
+                    project_container = ft.Container(
+                        content=ft.Column(
+                            [
+                                Row(
+                                    [
+                                        Text(proj.name, size=18, weight=ft.FontWeight.BOLD),
+                                        header_icon,
+                                        IconButton(
+                                            icon="open_in_new",
+                                            icon_color="blue",
+                                            on_click=partial(open_detail_click, proj.name),
+                                            tooltip="Open Detail",
+                                        ),
+                                        IconButton(
+                                            icon="delete",
+                                            icon_color="red",
+                                            on_click=partial(delete_click, proj),
+                                            tooltip="Delete Project",
+                                        ),
+                                    ],
+                                    alignment=alignment.center,
+                                    expand=True
+                                ),
+                                Text(f"Path: {proj.path}", size=12, color="grey_700"),
+                                Text("Containers:", size=14, weight=ft.FontWeight.W_600, color="grey_800"),
+                                containers_col,
+                            ],
+                            spacing=10,
+                        ),
+                        padding=_ROW_PAD,
+                        bgcolor="white",
+                        border=_ROW_BORDER,
+                        border_radius=_ROW_RADIUS,
+                        ink=True,
+                    )
+                    return project_container
+
+                rendered_count = 0
+                # (project icon, container icons by name) of each rendered card, in list order
+                card_icons: List[Tuple[ft.Icon, Dict[str, ft.Icon]]] = []
+
+                def render_next_page():
+                    nonlocal rendered_count
+                    batch = projects[rendered_count:rendered_count + PROJECT_LIST_PAGE_SIZE]
+                    project_list.controls.extend(build_project_card(proj) for proj in batch)
+                    rendered_count += len(batch)
+
+                def project_list_scroll(event: ft.OnScrollEvent):
+                    if rendered_count >= len(projects):
+                        return
+                    if event.pixels >= event.max_scroll_extent - PROJECT_LIST_LOAD_AHEAD:
+                        render_next_page()
+                        project_list.update()
+
+                project_list = ListView(
+                    spacing=10,
+                    padding=padding.all(20),
+                    expand=True,
+                    on_scroll=project_list_scroll,
+                )
+
+                def show_projects():
+                    if not projects:
+                        empty_state = ft.Container(
+                            content=Text(
+                                "No projects yet. Create one to get started!",
+                                size=16,
+                                text_align=ft.TextAlign.CENTER,
+                                color="grey_600",
                             ),
-                            padding=padding.all(15),
-                            bgcolor="white",
-                            border=border.all(1, "grey_300"),
-                            border_radius=border_radius.all(8),
-                            ink=True,
+                            alignment=alignment.center,
+                            padding=_PLACEHOLDER_PAD,
+                            expand=True,
                         )
-                        project_list.controls.append(project_container)
+                        project_list.controls.append(empty_state)
+                    else:
+                        render_next_page()
+
+                def projects_loaded(fut):
+                    nonlocal rendered_count
+                    try:
+                        loaded = fut.result()
+                    except Exception as ex:
+                        notify(f"Failed to load projects: {str(ex)}", bgcolor="red")
+                        page.update()
+                        return
+                    projects[:] = loaded  # already sorted by name
+                    rendered_count = 0
+                    project_list.controls.clear()
+                    card_icons.clear()
+                    show_projects()
+                    if project_list.page:
+                        project_list.update()
+
+                def statuses_refreshed(fut):
+                    try:
+                        loaded = fut.result()
+                    except Exception:
+                        return
+                    if not _copy_statuses(projects, loaded):
+                        # Projects or their containers changed: render the cards again
+                        projects_loaded(fut)
+                        return
+                    for proj, (header_icon, container_icons) in zip(projects, card_icons):
+                        _show_status_icon(header_icon, proj.status)
+                        for name, cont_icon in container_icons.items():
+                            _show_status_icon(cont_icon, proj.container_statuses.get(name, Status.NOT_CREATED))
+                    page.update()
+
+                def refresh_statuses():
+                    _io_executor.submit(get_projects_cached, current_root).add_done_callback(
+                        lambda fut: page.run_thread(statuses_refreshed, fut)
+                    )
+
+                # Show a spinner while projects load off the UI thread
+                project_list.controls.append(
+                    ft.Container(content=ProgressRing(), alignment=alignment.center, padding=_PLACEHOLDER_PAD)
+                )
+                _io_executor.submit(get_projects_cached, current_root).add_done_callback(
+                    lambda fut: page.run_thread(projects_loaded, fut)
+                )
 
                 # Add create button
                 create_button = ElevatedButton(
                     "Create New Project",
                     on_click=lambda event: page.go("/create"),
-                    style=ft.ButtonStyle(
-                        bgcolor="blue",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_BLUE,
                 )
 
                 # Add setup button for re-config
                 setup_button = ElevatedButton(
                     "Change Root Path",
                     on_click=lambda event: page.go("/setup"),
-                    style=ft.ButtonStyle(
-                        bgcolor="grey",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_GREY,
                 )
 
-                return View(
+                list_view = View(
                     "/",
                     [
                         AppBar(
                             title=Text("Projects"), 
                             bgcolor="on_surface_variant",
                             actions=[  # New: Refresh button
-                                IconButton(ft.Icons.REFRESH, on_click=lambda e: page.go("/"))
+                                IconButton(ft.Icons.REFRESH, on_click=lambda e: (invalidate_projects(), page.go("/")))
                             ]
                         ),
                         Row([create_button, setup_button], alignment=MainAxisAlignment.SPACE_BETWEEN),
                         project_list,
                     ],
                 )
+                # Run by cached_view when the view is revisited
+                list_view.data = refresh_statuses
+                return list_view
 
             # Shared helper for building container card
             def build_container_card(container_fields, containers_list, prefill_cont=None):
-                name_field = TextField(label="Container Name", width=200, value=prefill_cont.name if prefill_cont else "")
-                image_field = TextField(label="Image", hint_text="e.g., nginx:latest", width=200, value=prefill_cont.image if prefill_cont else "")
-                ports_field = TextField(label="Ports (host:container, comma-sep)", hint_text="e.g., 8080:80,3000:3000", width=300, value=",".join(f"{h}:{c}" for h, c in (prefill_cont.ports.items() if prefill_cont else {})))
-                volumes_field = TextField(label="Volumes (host:container, comma-sep)", hint_text="e.g., /data:/app,/logs:/var/log", width=300, value=",".join(f"{h}:{c}" for h, c in (prefill_cont.volumes.items() if prefill_cont else {})))
-                env_field = TextField(label="Env Vars (KEY=value, comma-sep)", hint_text="e.g., DB_HOST=localhost,NODE_ENV=prod", width=300, value=",".join(f"{k}={v}" for k, v in (prefill_cont.env.items() if prefill_cont else {})))
-                depends_field = TextField(label="Depends On (names, comma-sep)", hint_text="e.g., db,redis", width=300, value=",".join(prefill_cont.depends_on if prefill_cont else []))
+                if prefill_cont:
+                    name_v = prefill_cont.name
+                    image_v = prefill_cont.image
+                    ports_v = ",".join(f"{h}:{c}" for h, c in prefill_cont.ports.items())
+                    volumes_v = ",".join(f"{h}:{c}" for h, c in prefill_cont.volumes.items())
+                    env_v = ",".join(k if v is None else f"{k}={v}" for k, v in prefill_cont.env.items())
+                    depends_v = ",".join(prefill_cont.depends_on)
+                    restart_v = prefill_cont.restart_policy
+                else:
+                    name_v = image_v = ports_v = volumes_v = env_v = depends_v = ""
+                    restart_v = "unless-stopped"
+
+                name_field = TextField(label="Container Name", width=200, value=name_v)
+                image_field = TextField(label="Image", hint_text="e.g., nginx:latest", width=200, value=image_v)
+                ports_field = TextField(label="Ports (host:container, comma-sep)", hint_text="e.g., 8080:80,3000:3000", width=300, value=ports_v)
+                volumes_field = TextField(label="Volumes (host:container, comma-sep)", hint_text="e.g., /data:/app,/logs:/var/log", width=300, value=volumes_v)
+                env_field = TextField(label="Env Vars (KEY=value, comma-sep)", hint_text="e.g., DB_HOST=localhost,NODE_ENV=prod", width=300, value=env_v)
+                depends_field = TextField(label="Depends On (names, comma-sep)", hint_text="e.g., db,redis", width=300, value=depends_v)
 
                 # Fixed: Use Dropdown with DropdownOption (replaces TextField workaround)
                 restart_dropdown = Dropdown(
                     label="Restart Policy",
-                    options=[
-                        ft.DropdownOption("no"),
-                        ft.DropdownOption("on-failure"),
-                        ft.DropdownOption("always"),
-                        ft.DropdownOption("unless-stopped"),
-                    ],
-                    value=prefill_cont.restart_policy if prefill_cont else "unless-stopped",
+                    options=[ft.DropdownOption(v) for v in _RESTART_POLICIES],
+                    value=restart_v,
                     width=200,
                 )
 
@@ -333,15 +712,15 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                             ],
                             spacing=10,
                         ),
-                        padding=padding.all(10),
+                        padding=_CARD_PAD,
                     ),
                     elevation=2,
                 )
 
                 # Set on_click after card is defined
-                remove_btn.on_click = lambda e: (containers_list.controls.remove(card), container_fields.remove(fields_dict), containers_list.update())
+                remove_btn.on_click = lambda e: (containers_list.controls.remove(card), container_fields.pop(id(card), None), containers_list.update())
 
-                container_fields.append(fields_dict)
+                container_fields[id(card)] = fields_dict
                 return card
 
             # Create view with multistep form
@@ -358,7 +737,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                 )
 
                 containers_list = ListView(expand=1, spacing=10)
-                container_fields = []  # List of dicts for fields
+                container_fields = {}  # Field dicts keyed by id() of their card
 
                 def add_container_click(e):
                     card = build_container_card(container_fields, containers_list)
@@ -369,7 +748,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 freeform_section = Column(
                     [
-                        Text("Containers:", size=16, weight=ft.FontWeight.W_600),
+                        _section_label("Containers:"),
                         add_cont_btn,
                         containers_list,
                     ],
@@ -379,74 +758,42 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 def create_project_click(event):
                     if not name_field.value or not name_field.value.strip():
-                        page.snack_bar = ft.SnackBar(content=ft.Text("Please enter a project name."))
+                        notify("Please enter a project name.")
                         page.update()
                         return
 
-                    parsed_containers = []
-                    for fields in container_fields:
-                        cname = fields['name'].value.strip()
-                        if not cname:
-                            continue
-                        cimage = fields['image'].value.strip() or "nginx:latest"
-                        ports = {}
-                        for p in (fields['ports'].value or "").split(","):
-                            p = p.strip()
-                            if ":" in p:
-                                h, c = p.split(":", 1)
-                                ports[h.strip()] = c.strip()
-                        volumes = {}
-                        for v in (fields['volumes'].value or "").split(","):
-                            v = v.strip()
-                            if ":" in v:
-                                h, c = v.split(":", 1)
-                                volumes[h.strip()] = c.strip()
-                        env = {}
-                        for ev in (fields['env'].value or "").split(","):
-                            ev = ev.strip()
-                            if "=" in ev:
-                                k, val = ev.split("=", 1)
-                                env[k.strip()] = val.strip()
-                        depends_on = [d.strip() for d in (fields['depends_on'].value or "").split(",") if d.strip()]
-                        restart = fields['restart'].value or "unless-stopped"
-                        parsed_containers.append(Container(cname, cimage, ports, volumes, env, depends_on, restart))
+                    parsed_containers = _parse_containers(container_fields.values())
 
-                    try:
-                        new_project = service_instance.create_project(
-                            name_field.value.strip(),
-                            current_root,
-                            parsed_containers,
-                        )
+                    def project_created(new_project):
+                        invalidate_projects()
                         name_field.value = ""
-
                         container_fields.clear()
                         containers_list.controls.clear()
-                        containers_list.update()
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Project '{new_project.name}' created successfully!"))
-                        page.update()
-                        page.go("/")
-                    except Exception as ex:
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Error creating project: {str(ex)}"), bgcolor="red")
+                        notify_and_go(f"Project '{new_project.name}' created successfully!", "/")
+
+                    def create_failed(ex):
+                        notify(f"Error creating project: {str(ex)}", bgcolor="red")
                         page.update()
 
+                    run_io(
+                        service_instance.create_project,
+                        name_field.value.strip(),
+                        current_root,
+                        parsed_containers,
+                        on_done=project_created,
+                        on_error=create_failed,
+                    )
+
                 create_button = ElevatedButton(
                     "Create Project",
                     on_click=create_project_click,
-                    style=ft.ButtonStyle(
-                        bgcolor="green",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_GREEN,
                 )
 
                 cancel_button = ElevatedButton(
                     "Cancel",
-                    on_click=lambda event: page.go("/"),
-                    style=ft.ButtonStyle(
-                        bgcolor="grey",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    on_click=lambda event: (view_cache.pop("/create", None), page.go("/")),
+                    style=_BTN_GREY,
                 )
 
                 form_scroll = Column(
@@ -464,7 +811,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 form_container = ft.Container(
                     content=form_scroll,
-                    padding=padding.all(40),
+                    padding=_VIEW_PAD,
                     alignment=alignment.center,
                     expand=True,
                 )
@@ -478,27 +825,19 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                 )
 
             # Update view (Enhanced: Similar to create, pre-fill cards)
-            def build_update_view():
+            def build_update_view(project_name):
                 if not current_root:
                     page.go("/setup")
                     return None
 
-                current_route = page.route
-                project_name = unquote(current_route.split("/update/")[1]) if "/update/" in current_route else ""
                 if not project_name:
-                    snack = ft.SnackBar(content=ft.Text("Invalid project name."), bgcolor="red")
-                    page.snack_bar = snack
-                    page.update()
-                    page.go("/")
+                    notify_and_go("Invalid project name.", "/", bgcolor="red")
                     return None
 
                 # New: Load via get_project
                 project_to_update = service_instance.get_project(current_root, project_name)
                 if not project_to_update:
-                    snack = ft.SnackBar(content=ft.Text(f"Project '{project_name}' not found."), bgcolor="red")
-                    page.snack_bar = snack
-                    page.update()
-                    page.go("/")
+                    notify_and_go(f"Project '{project_name}' not found.", "/", bgcolor="red")
                     return None
 
                 name_field = TextField(
@@ -509,7 +848,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 # Containers: Pre-populate cards
                 containers_list = ListView(expand=1, spacing=10)
-                container_fields = []
+                container_fields = {}
 
                 def add_container_click(e):
                     card = build_container_card(container_fields, containers_list)
@@ -517,105 +856,72 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                     containers_list.update()
 
                 # Pre-fill existing containers
-                for cont in project_to_update.containers:
-                    card = build_container_card(container_fields, containers_list, prefill_cont=cont)
-                    containers_list.controls.append(card)
+                containers_list.controls.extend(
+                    [build_container_card(container_fields, containers_list, prefill_cont=cont) for cont in project_to_update.containers]
+                )
 
                 add_cont_btn = ElevatedButton("Add Container", on_click=add_container_click)
 
                 def update_project_click(event):
                     new_name = name_field.value.strip() if name_field.value else ""
                     if not new_name:
-                        page.snack_bar = ft.SnackBar(content=ft.Text("Please enter a project name."))
+                        notify("Please enter a project name.")
+                        page.update()
+                        return
+                    renamed = new_name != project_to_update.name
+                    # Check uniqueness
+                    if renamed and service_instance.project_exists(current_root, new_name):
+                        notify("Name already exists.", bgcolor="red")
                         page.update()
                         return
-                    if new_name != project_to_update.name:
-                        # Check uniqueness
-                        existing = service_instance.get_project(current_root, new_name)
-                        if existing and existing != project_to_update:
-                            page.snack_bar = ft.SnackBar(content=ft.Text("Name already exists."), bgcolor="red")
-                            page.update()
-                            return
-
-                    # New: Handle rename if name changed
-                    old_path = project_to_update.path
-                    if new_name != project_to_update.name:
-                        new_path = current_root / new_name
-                        try:
-                            shutil.move(str(old_path), str(new_path))
-                            project_to_update.path = new_path
-                        except Exception as rename_ex:
-                            page.snack_bar = ft.SnackBar(content=ft.Text(f"Rename failed: {str(rename_ex)}"), bgcolor="red")
-                            page.update()
-                            return
-
-                    project_to_update.name = new_name
 
                     # Parse containers (enhanced)
-                    parsed_containers = []
-                    for fields in container_fields:
-                        cname = fields['name'].value.strip()
-                        if not cname:
-                            continue
-                        cimage = fields['image'].value.strip() or "nginx:latest"
-                        ports = {}
-                        for p in (fields['ports'].value or "").split(","):
-                            p = p.strip()
-                            if ":" in p:
-                                h, c = p.split(":", 1)
-                                ports[h.strip()] = c.strip()
-                        volumes = {}
-                        for v in (fields['volumes'].value or "").split(","):
-                            v = v.strip()
-                            if ":" in v:
-                                h, c = v.split(":", 1)
-                                volumes[h.strip()] = c.strip()
-                        env = {}
-                        for ev in (fields['env'].value or "").split(","):
-                            ev = ev.strip()
-                            if "=" in ev:
-                                k, val = ev.split("=", 1)
-                                env[k.strip()] = val.strip()
-                        depends_on = [d.strip() for d in (fields['depends_on'].value or "").split(",") if d.strip()]
-                        restart = fields['restart'].value or "unless-stopped"
-                        parsed_containers.append(Container(cname, cimage, ports, volumes, env, depends_on, restart))
-
-                    project_to_update.containers = parsed_containers
-
-                    try:
+                    parsed_containers = _parse_containers(container_fields.values())
+                    new_path = current_root / new_name
+
+                    def save():
+                        # New: Handle rename if name changed
+                        if renamed:
+                            # Both paths are under current_root, so this is a single rename
+                            os.replace(project_to_update.path, new_path)
+                            project_to_update.path = new_path
+                        project_to_update.name = new_name
+                        project_to_update.containers = parsed_containers
                         service_instance.update_project(project_to_update)
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Project '{project_to_update.name}' updated successfully!"))
-                        page.update()
-                        page.go("/")  # Navigate back to projects list
-                    except Exception as ex:
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Error updating project: {str(ex)}"), bgcolor="red")
+
+                    def project_updated(_):
+                        invalidate_projects()
+                        notify_and_go(f"Project '{project_to_update.name}' updated successfully!", "/")  # Navigate back to projects list
+
+                    def update_failed(ex):
+                        if renamed and project_to_update.path != new_path:
+                            message = f"Rename failed: {str(ex)}"
+                        else:
+                            if renamed:
+                                invalidate_projects()
+                            message = f"Error updating project: {str(ex)}"
+                        notify(message, bgcolor="red")
                         page.update()
 
+                    run_io(save, on_done=project_updated, on_error=update_failed)
+
                 update_button = ElevatedButton(
                     "Update Project",
                     on_click=update_project_click,
-                    style=ft.ButtonStyle(
-                        bgcolor="orange",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_ORANGE,
                 )
 
                 cancel_button = ElevatedButton(
                     "Cancel",
                     on_click=lambda event: page.go("/"),
-                    style=ft.ButtonStyle(
-                        bgcolor="grey",
-                        color="white",
-                        shape=ft.RoundedRectangleBorder(radius=8),
-                    ),
+                    style=_BTN_GREY,
                 )
 
                 form_scroll = Column(
                     [
                         Text("Update Project", size=24, weight=ft.FontWeight.BOLD),
                         name_field,
-                        Text("Containers:", size=16, weight=ft.FontWeight.W_600),
+                        _section_label("Containers:"),
                         add_cont_btn,
                         containers_list,
                         Row([update_button, cancel_button], alignment=alignment.center),
@@ -628,7 +934,7 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 form_container = ft.Container(
                     content=form_scroll,
-                    padding=padding.all(40),
+                    padding=_VIEW_PAD,
                     alignment=alignment.center,
                     expand=True,
                 )
@@ -641,106 +947,124 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                     ],
                 )
 
-            def build_detail_view():
+            def build_detail_view(project_name):
                 if not current_root:
                     page.go("/setup")
                     return None
-                current_route = page.route
-                project_name = unquote(current_route.split("/detail/")[1]) if "/detail/" in current_route else ""
                 if not project_name:
-                    snack = ft.SnackBar(content=ft.Text("Invalid project name."), bgcolor="red")
-                    page.snack_bar = snack
-                    page.update()
-                    page.go("/")
+                    notify_and_go("Invalid project name.", "/", bgcolor="red")
                     return None
 
                 # Load via get_project
                 project = service_instance.get_project(current_root, project_name)
                 if not project:
-                    snack = ft.SnackBar(content=ft.Text(f"Project '{project_name}' not found."), bgcolor="red")
-                    page.snack_bar = snack
-                    page.update()
-                    page.go("/")
+                    notify_and_go(f"Project '{project_name}' not found.", "/", bgcolor="red")
                     return None
 
-                status_str = str(project.status)
-                status_color = "green" if project.status == Status.RUNNING else "grey" if project.status == Status.NOT_CREATED else "red"
-                status_icon = "check_circle" if project.status == Status.RUNNING else "radio_button_unchecked" if project.status == Status.NOT_CREATED else "pause_circle"
+                status_icon, status_color, status_str = _STATUS_META[project.status]
 
                 # Enhanced containers section with more details
-                containers_list = ListView(spacing=5)
-                for cont in project.containers:
-                    cont_status = project.container_statuses.get(cont.name, Status.NOT_CREATED)
-                    cont_status_str = str(cont_status)
-                    cont_status_color = "green" if cont_status == Status.RUNNING else "grey" if cont_status == Status.NOT_CREATED else "red"
-                    cont_status_icon = "check_circle" if cont_status == Status.RUNNING else "radio_button_unchecked" if cont_status == Status.NOT_CREATED else "pause_circle"
-                    ports_str = ", ".join(f"{h}:{c}" for h, c in cont.ports.items()) or "None"
-                    volumes_str = ", ".join(f"{h}:{c}" for h, c in cont.volumes.items()) or "None"
-                    env_str = ", ".join(f"{k}={v}" for k, v in cont.env.items()) or "None"
-                    depends_str = ", ".join(cont.depends_on) or "None"
-                    containers_list.controls.append(
+                # Container details are only built when their tile is first expanded
+                def expand_container(cont, e):
+                    tile = e.control
+                    if e.data != "true" or tile.controls:
+                        return
+                    tile.controls = [
                         Column(
                             [
-                                Row(
-                                    [
-                                        Text(f"{cont.name}: {cont.image}", weight=ft.FontWeight.W_500),
-                                        IconButton(icon=cont_status_icon, icon_color=cont_status_color, tooltip=cont_status_str, icon_size=16),
-                                    ]
-                                ),
-                                Text(f"Ports: {ports_str}", size=12, color="grey_600"),
-                                Text(f"Volumes: {volumes_str}", size=12, color="grey_600"),
-                                Text(f"Env: {env_str}", size=12, color="grey_600"),
-                                Text(f"Depends On: {depends_str}", size=12, color="grey_600"),
-                                Text(f"Restart: {cont.restart_policy}", size=12, color="grey_600"),
+                                _small_grey_text("Ports: " + _format_pairs(cont.ports)),
+                                _small_grey_text("Volumes: " + _format_pairs(cont.volumes)),
+                                _small_grey_text("Env: " + _format_pairs(cont.env, "%s=%s")),
+                                _small_grey_text("Depends On: " + (", ".join(cont.depends_on) if cont.depends_on else "None")),
+                                _small_grey_text(f"Restart: {cont.restart_policy}"),
                             ],
                             spacing=2,
                         )
+                    ]
+                    tile.update()
+
+                container_rows = []
+                container_icons: Dict[str, ft.Icon] = {}
+                container_statuses = project.container_statuses
+                for cont in project.containers:
+                    cont_status = container_statuses.get(cont.name, Status.NOT_CREATED)
+                    cont_status_icon, cont_status_color, cont_status_str = _STATUS_META[cont_status]
+                    cont_icon = ft.Icon(name=cont_status_icon, color=cont_status_color, size=16, tooltip=cont_status_str)
+                    container_icons[cont.name] = cont_icon
+                    container_rows.append(
+                        ft.ExpansionTile(
+                            title=Text(f"{cont.name}: {cont.image}", weight=ft.FontWeight.W_500),
+                            leading=cont_icon,
+                            controls_padding=_TILE_BODY_PAD,
+                            expanded_cross_axis_alignment=ft.CrossAxisAlignment.START,
+                            on_change=partial(expand_container, cont),
+                        )
                     )
+                containers_list = ListView(container_rows, spacing=5)
+
+                status_icon_ctrl = ft.Icon(status_icon, color=status_color, size=32)  # Fixed: ft.Icon
+                status_text_ctrl = Text(f"Status: {status_str.upper()}", size=18)
+
+                def compose_and_refresh(operation):
+                    try:
+                        return operation(project, on_progress=show_progress)
+                    finally:
+                        flush_progress()
+                        service_instance.refresh_status_only(project)
+
+                def show_statuses():
+                    """Patch the status controls in place from the refreshed project."""
+                    icon, color, label = _STATUS_META[project.status]
+                    status_icon_ctrl.name = icon
+                    status_icon_ctrl.color = color
+                    status_text_ctrl.value = f"Status: {label.upper()}"
+                    for name, cont_icon in container_icons.items():
+                        _show_status_icon(cont_icon, project.container_statuses.get(name, Status.NOT_CREATED))
+                    is_running = project.status is Status.RUNNING
+                    start_button.disabled = is_running
+                    stop_button.disabled = not is_running
+
+                def statuses_changed():
+                    # Other cached views show the old state; this one is patched in place
+                    invalidate_views()
+                    keep_view(current_route)
+                    show_statuses()
 
                 # Actions: Start/Stop (removed Delete) with handlers
                 def start_project_click(e):
-                    progress_ring = ProgressRing(visible=True, width=20, height=20)
-                    page.overlay.append(progress_ring)
-                    page.update()
-                    try:
-                        output = service_instance.start_project(project)
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Started: {output or 'Success'}"))
-                        page.snack_bar.open = True
-                        page.update()
-                        # Fixed: Refresh current detail view to update status
-                        page.go(f"/detail/{project.name}")
-                    except Exception as ex:
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Start failed: {str(ex)}"), bgcolor=ft.Colors.RED)
-                        page.snack_bar.open = True
+                    def started(output):
+                        statuses_changed()
+                        notify(f"Started: {output or 'Success'}")
                         page.update()
-                    finally:
-                        page.overlay.remove(progress_ring)
+
+                    def start_failed(ex):
+                        statuses_changed()
+                        notify(f"Start failed: {str(ex)}", bgcolor=ft.Colors.RED)
                         page.update()
 
+                    run_io(compose_and_refresh, service_instance.start_project, on_done=started, on_error=start_failed)
+
                 def stop_project_click(e):
-                    progress_ring = ProgressRing(visible=True, width=20, height=20)
-                    page.overlay.append(progress_ring)
-                    page.update()
-                    try:
-                        output = service_instance.stop_project(project)
+                    def stopped(output):
+                        statuses_changed()
                         msg = f"Stopped: {output}" if output else "Project stopped."
-                        page.snack_bar = ft.SnackBar(content=ft.Text(msg))
-                        page.snack_bar.open = True
+                        notify(msg)
                         page.update()
-                        # Fixed: Refresh current detail view to update status
-                        page.go(f"/detail/{project.name}")
-                    except Exception as ex:
-                        page.snack_bar = ft.SnackBar(content=ft.Text(f"Stop failed: {str(ex)}"), bgcolor=ft.Colors.RED)
-                        page.snack_bar.open = True
-                        page.update()
-                    finally:
-                        page.overlay.remove(progress_ring)
+
+                    def stop_failed(ex):
+                        statuses_changed()
+                        notify(f"Stop failed: {str(ex)}", bgcolor=ft.Colors.RED)
                         page.update()
 
+                    run_io(compose_and_refresh, service_instance.stop_project, on_done=stopped, on_error=stop_failed)
+
+                is_running = project.status is Status.RUNNING
+                start_button = ElevatedButton("Start", icon=ft.Icons.PLAY_ARROW, style=_BTN_TEXT_GREEN, on_click=start_project_click, disabled=is_running)
+                stop_button = ElevatedButton("Stop", icon=ft.Icons.STOP, style=_BTN_TEXT_RED, on_click=stop_project_click, disabled=not is_running)
                 actions_row = Row(
                     [
-                        ElevatedButton("Start", icon=ft.Icons.PLAY_ARROW, style=ft.ButtonStyle(color="green"), on_click=start_project_click, disabled=project.status == Status.RUNNING),
-                        ElevatedButton("Stop", icon=ft.Icons.STOP, style=ft.ButtonStyle(color="red"), on_click=stop_project_click, disabled=project.status != Status.RUNNING),
+                        start_button,
+                        stop_button,
                         ElevatedButton("Back to List", on_click=lambda _: page.go("/")),
                     ],
                     alignment=MainAxisAlignment.SPACE_AROUND,
@@ -752,14 +1076,11 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                     [
                         Text(f"Project: {project.name}", size=24, weight=ft.FontWeight.BOLD),
                         Row(
-                            [
-                                ft.Icon(status_icon, color=status_color, size=32),  # Fixed: ft.Icon
-                                Text(f"Status: {status_str.upper()}", size=18),
-                            ],
+                            [status_icon_ctrl, status_text_ctrl],
                             alignment=MainAxisAlignment.START,
                         ),
                         Text(f"Path: {project.path}", size=14, color="grey_700"),
-                        Text("Containers:", size=16, weight=ft.FontWeight.W_600),
+                        _section_label("Containers:"),
                         containers_list,
                         actions_row,
                     ],
@@ -771,11 +1092,21 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
 
                 detail_container = ft.Container(
                     content=detail_scroll,
-                    padding=padding.all(40),
+                    padding=_VIEW_PAD,
                     alignment=alignment.center,
                 )
 
-                return View(
+                def statuses_refreshed(fut):
+                    if fut.exception() is None:
+                        show_statuses()
+                        page.update()
+
+                def refresh_statuses():
+                    _io_executor.submit(service_instance.refresh_status_only, project).add_done_callback(
+                        lambda fut: page.run_thread(statuses_refreshed, fut)
+                    )
+
+                detail_view = View(
                     f"/detail/{project_name}",
                     [
                         AppBar(
@@ -786,31 +1117,62 @@ def launch_ui(service_instance: ProjectService, root_path: Optional[Path]):
                         detail_container,
                     ],
                 )
+                # Run by cached_view when the view is revisited
+                detail_view.data = refresh_statuses
+                return detail_view
 
             # Append views based on route
             current_route = page.route
+
+            def cached_view(route, builder):
+                cached = view_cache.get(route)
+                if cached and cached[1] == data_version:
+                    view_cache.move_to_end(route)
+                    view = cached[0]
+                    # Docker state may have changed outside the app; let the revealed view re-check it
+                    if route == current_route and view.data:
+                        view.data()
+                    return view
+                view = builder()
+                if view:
+                    view_cache[route] = (view, data_version)
+                    view_cache.move_to_end(route)
+                    while len(view_cache) > VIEW_CACHE_SIZE:
+                        view_cache.popitem(last=False)
+                return view
+
             if current_route == "/setup" or not current_root:
-                setup_view = build_setup_view()
+                setup_view = cached_view("/setup", build_setup_view)
                 page.views.append(setup_view)
             else:
-                main_view = build_project_list_view()
+                main_view = cached_view("/", build_project_list_view)
                 if main_view:
                     page.views.append(main_view)
                 if current_route == "/create":
-                    create_view = build_create_view()
+                    create_view = cached_view("/create", build_create_view)
                     if create_view:
                         page.views.append(create_view)
                 elif current_route.startswith("/update/"):
-                    update_view = build_update_view()
+                    update_view = build_update_view(_route_project_name(current_route, "/update/"))
                     if update_view:
                         page.views.append(update_view)
                 elif current_route.startswith("/detail/"):
-                    detail_view = build_detail_view()
+                    project_name = _route_project_name(current_route, "/detail/")
+                    detail_view = cached_view(current_route, partial(build_detail_view, project_name))
                     if detail_view:
                         page.views.append(detail_view)
 
+            # A builder redirected: page.go() only armed the debounced render, so build the
+            # new route now rather than leave a half-built stack up until the timer fires
+            if page.route != current_route:
+                with pending_lock:
+                    if pending_render is not None:
+                        pending_render.cancel()
+                build_route()
+                return
             # Update the current view
             page.update()
+            rendered_state = render_state
 
         # Handle route changes
         page.on_route_change = route_change